@@ -1,15 +1,20 @@
 import streamlit as st
-import json
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
-import copy
-from PIL import Image
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional
 import io
 import csv
 import base64
-import pandas as pd
 
-@dataclass
+# Bit positions for Character.status_mask.
+ALIVE_BIT = 1 << 0
+WOUNDED_BIT = 1 << 1
+MORTAL_BIT = 1 << 2
+IMPAIRED_BIT = 1 << 3
+FATIGUED_BIT = 1 << 4
+SCARRED_BIT = 1 << 5
+
+@dataclass(slots=True)
 class Character:
     """Represents a Mythic Bastionland character with combat stats."""
     name: str
@@ -29,18 +34,18 @@ class Character:
     is_scarred: bool = False
     is_alive: bool = True
     notes: str = ""
-    profile_image: bytes = None
+    profile_image_sha: Optional[str] = None  # key into the shared image store
     
     def apply_damage(self, damage: int) -> Dict[str, any]:
         """Apply damage following Mythic Bastionland rules."""
         original_damage = damage
-        damage_log = []
+        damage_log = []  # (tag, *args) events; see _EVENT_RENDERERS
         
         # Step 1: Subtract Armor
         if self.armor > 0:
             armor_absorbed = min(damage, self.armor)
             damage -= armor_absorbed
-            damage_log.append(f"Armor absorbed {armor_absorbed} damage")
+            damage_log.append(("armor", armor_absorbed))
         
         # Step 2: Subtract from Guard
         scar_inflicted = False
@@ -49,7 +54,7 @@ class Character:
             guard_damage = min(damage, self.guard)
             self.guard -= guard_damage
             damage -= guard_damage
-            damage_log.append(f"Guard reduced by {guard_damage} (now {self.guard})")
+            damage_log.append(("guard", guard_damage, self.guard))
         
         # Step 3: Subtract remaining damage from Vigor
         vigor_damage = 0
@@ -60,30 +65,30 @@ class Character:
             original_vigor = self.vigor
             vigor_damage = min(damage, self.vigor)
             self.vigor -= vigor_damage
-            damage_log.append(f"Vigor reduced by {vigor_damage} (now {self.vigor})")
+            damage_log.append(("vigor", vigor_damage, self.vigor))
             
             # Character becomes wounded when losing any Vigor
             if vigor_damage > 0:
                 self.is_wounded = True
                 wounded = True
-                damage_log.append("🩸 Character is now WOUNDED!")
+                damage_log.append(("wounded",))
             
             # Check for Mortal Wound (half or more of current Vigor)
             if vigor_damage >= (original_vigor / 2):
                 self.is_mortally_wounded = True
                 mortal_wound_inflicted = True
-                damage_log.append("⚠️ MORTAL WOUND inflicted!")
+                damage_log.append(("mortal",))
             
             # Check for death
             if self.vigor <= 0:
                 self.is_alive = False
-                damage_log.append("💀 CHARACTER SLAIN!")
+                damage_log.append(("slain",))
         
         # Check for Scar (Guard reduced to exactly 0 AND no Vigor damage)
         if original_guard > 0 and self.guard == 0 and vigor_damage == 0:
             self.is_scarred = True
             scar_inflicted = True
-            damage_log.append("🔥 SCAR inflicted! (Guard reduced to 0 with no Vigor loss)")
+            damage_log.append(("scar",))
         
         return {
             "original_damage": original_damage,
@@ -95,6 +100,47 @@ class Character:
             "character_slain": not self.is_alive
         }
     
+    @property
+    def status_mask(self) -> int:
+        """Pack the status flags into one int for cheap render dispatch."""
+        return (
+            (self.is_alive << 0)
+            | (self.is_wounded << 1)
+            | (self.is_mortally_wounded << 2)
+            | (self.is_impaired << 3)
+            | (self.is_fatigued << 4)
+            | (self.is_scarred << 5)
+        )
+
+    @property
+    def status_label(self) -> str:
+        """Primary status label, derived from the packed status mask."""
+        mask = self.status_mask
+        if not mask & ALIVE_BIT:
+            return "💀 Slain"
+        if mask & MORTAL_BIT:
+            return "⚠️ Mortally Wounded"
+        if mask & WOUNDED_BIT:
+            return "🩸 Wounded"
+        return "✅ Healthy"
+
+    @property
+    def conditions_label(self) -> str:
+        """Secondary conditions joined with pipes, or an em dash when none apply."""
+        conditions = []
+        if self.is_impaired:
+            conditions.append("🔴 Impaired")
+        if self.is_fatigued:
+            conditions.append("😴 Fatigued")
+        if self.is_scarred:
+            conditions.append("🔥 Scarred")
+        return " | ".join(conditions) if conditions else "—"
+
+    @property
+    def notes_preview(self) -> str:
+        """First 30 characters of the notes, with an ellipsis when truncated."""
+        return (self.notes[:30] + "...") if len(self.notes) > 30 else self.notes
+
     def heal_vigor(self, amount: int):
         """Heal Vigor up to maximum."""
         self.vigor = min(self.vigor + amount, self.max_vigor)
@@ -120,53 +166,212 @@ class Character:
         self.is_scarred = False
         self.is_alive = True
 
+@st.cache_resource
+def _image_store() -> Dict[str, bytes]:
+    """Content-addressed store of uploaded image bytes, shared across characters."""
+    return {}
+
+def _store_image(data: bytes) -> str:
+    """Put image bytes in the shared store and return their SHA-256 key."""
+    sha = hashlib.sha256(data).hexdigest()
+    _image_store()[sha] = data
+    return sha
+
+def _get_image(sha: Optional[str]) -> Optional[bytes]:
+    """Fetch image bytes by SHA-256 key, or None if absent."""
+    return _image_store().get(sha) if sha else None
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _decode_profile_image(data: bytes):
+    """Decode image bytes once and reuse the PIL image across reruns."""
+    from PIL import Image  # deferred: only image-handling paths pay the import
+    return Image.open(io.BytesIO(data)).copy()
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _make_thumbnail(data: bytes) -> bytes:
+    """Downscale full-resolution image bytes to a small JPEG for display."""
+    from PIL import Image  # deferred: only image-handling paths pay the import
+    img = _decode_profile_image(data)
+    img.thumbnail((400, 400), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    img.convert("RGB").save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+# How each damage_log event tag is rendered in the resolution log.
+_EVENT_RENDERERS = {
+    "armor": (st.info, "Armor absorbed {0} damage"),
+    "guard": (st.warning, "Guard reduced by {0} (now {1})"),
+    "vigor": (st.warning, "Vigor reduced by {0} (now {1})"),
+    "wounded": (st.warning, "🩸 Character is now WOUNDED!"),
+    "mortal": (st.error, "⚠️ MORTAL WOUND inflicted!"),
+    "slain": (st.error, "💀 CHARACTER SLAIN!"),
+    "scar": (st.warning, "🔥 SCAR inflicted! (Guard reduced to 0 with no Vigor loss)"),
+}
+
+# Status filter predicates and sort keys for the character overview.
+_STATUS_PREDICATES = {
+    "All": lambda c: True,
+    "Alive": lambda c: c.is_alive,
+    "Dead": lambda c: not c.is_alive,
+    "Wounded": lambda c: c.is_alive and c.is_wounded,
+    "Mortally Wounded": lambda c: c.is_alive and c.is_mortally_wounded,
+    "Impaired": lambda c: c.is_alive and c.is_impaired,
+    "Fatigued": lambda c: c.is_alive and c.is_fatigued,
+    "Scarred": lambda c: c.is_alive and c.is_scarred,
+}
+
+_SORT_KEYS = {
+    "Name": lambda item: item[0],
+    "VIG": lambda item: item[1].vigor,
+    "GRD": lambda item: item[1].guard,
+}
+
+# Characters shown per page of the overview grid/table.
+PAGE_SIZE = 25
+
+# Bound format templates reused by the per-character render paths.
+_IMAGE_NAME_FMT = "🖼️ {}".format
+_STAT_FMT = "{}/{}".format
+_VIG_BAR_FMT = "VIG: {}/{}".format
+_GRD_BAR_FMT = "GRD: {}/{}".format
+
 def load_characters() -> Dict[str, Character]:
     """Load characters from session state."""
-    if 'characters' not in st.session_state:
-        st.session_state.characters = {}
-    return st.session_state.characters
+    return st.session_state.setdefault('characters', {})
+
+def _roster_snapshot(characters: Dict[str, Character]) -> tuple:
+    """Hashable snapshot of the whole roster, for cache keying.
+
+    The cache below is shared across sessions, so the key must describe
+    the roster contents themselves, not a session-local counter.
+    """
+    return tuple(_character_snapshot(character) for character in characters.values())
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _overview_names(snapshot: tuple, status_filter: str, sort_by: str, _characters: Dict[str, Character]) -> tuple:
+    """Filtered, sorted character names for the overview.
+
+    Keyed on the roster snapshot and the active filter/sort so pure-UI
+    reruns (e.g. selecting a target) skip the filter and sort entirely.
+    Returns names only: Character is redefined on every script run, so
+    instances can't round-trip through the cache's pickling — callers
+    resolve names against the live roster instead.
+    """
+    predicate = _STATUS_PREDICATES[status_filter]
+    items = [(name, char) for name, char in _characters.items() if predicate(char)]
+    items.sort(key=_SORT_KEYS[sort_by], reverse=sort_by != "Name")
+    return tuple(name for name, _ in items)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _overview_stats(snapshot: tuple, status_filter: str, _characters: Dict[str, Character]) -> Dict[str, int]:
+    """Summary condition counts for the filtered roster, keyed like _overview_items."""
+    predicate = _STATUS_PREDICATES[status_filter]
+    # Count every condition in one pass instead of a sum() per condition
+    total = alive = wounded = mortally_wounded = impaired = fatigued = scarred = 0
+    for char in _characters.values():
+        if not predicate(char):
+            continue
+        total += 1
+        if char.is_alive:
+            alive += 1
+            if char.is_wounded:
+                wounded += 1
+            if char.is_mortally_wounded:
+                mortally_wounded += 1
+            if char.is_impaired:
+                impaired += 1
+            if char.is_fatigued:
+                fatigued += 1
+            if char.is_scarred:
+                scarred += 1
+    return {
+        'total': total,
+        'alive': alive,
+        'dead': total - alive,
+        'wounded': wounded,
+        'mortally_wounded': mortally_wounded,
+        'impaired': impaired,
+        'fatigued': fatigued,
+        'scarred': scarred,
+    }
+
+def _alive_index() -> set:
+    """Names of living characters, maintained incrementally on mutation."""
+    return st.session_state.setdefault('alive_names', set())
 
 def save_character(character: Character):
     """Save a character to session state."""
-    if 'characters' not in st.session_state:
-        st.session_state.characters = {}
-    st.session_state.characters[character.name] = character
+    load_characters()[character.name] = character
+    alive = _alive_index()
+    if character.is_alive:
+        alive.add(character.name)
+    else:
+        alive.discard(character.name)
 
 def delete_character(name: str):
     """Delete a character from session state."""
     if 'characters' in st.session_state and name in st.session_state.characters:
         del st.session_state.characters[name]
+    _alive_index().discard(name)
+
+def _character_snapshot(character: Character) -> tuple:
+    """Hashable content key for a character's current state.
+
+    Covers every field the overview and export render; the image is
+    represented by its SHA-256 key rather than its bytes.
+    """
+    return (
+        character.name,
+        character.vigor, character.max_vigor,
+        character.clarity, character.max_clarity,
+        character.spirit, character.max_spirit,
+        character.guard, character.max_guard,
+        character.armor,
+        character.status_mask,
+        character.notes,
+        character.profile_image_sha,
+    )
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _character_export_row(snapshot: tuple, _character: Character) -> Dict[str, any]:
+    """Serialize one character for CSV export.
+
+    Cached on the character's content snapshot so unchanged characters
+    skip the field walk and the base64 encode of their image bytes on
+    repeated exports.
+    """
+    return {
+        'name': _character.name,
+        'vigor': _character.vigor,
+        'max_vigor': _character.max_vigor,
+        'clarity': _character.clarity,
+        'max_clarity': _character.max_clarity,
+        'spirit': _character.spirit,
+        'max_spirit': _character.max_spirit,
+        'guard': _character.guard,
+        'max_guard': _character.max_guard,
+        'armor': _character.armor,
+        'is_mortally_wounded': _character.is_mortally_wounded,
+        'is_wounded': _character.is_wounded,
+        'is_impaired': _character.is_impaired,
+        'is_fatigued': _character.is_fatigued,
+        'is_scarred': _character.is_scarred,
+        'is_alive': _character.is_alive,
+        'notes': _character.notes,
+        'profile_image_base64': base64.b64encode(image_bytes).decode() if (image_bytes := _get_image(_character.profile_image_sha)) else ""
+    }
 
 def export_characters_to_csv(characters: Dict[str, Character]) -> str:
     """Export characters to CSV format."""
     if not characters:
         return ""
-    
+
     # Create CSV data
-    csv_data = []
-    for name, character in characters.items():
-        row = {
-            'name': character.name,
-            'vigor': character.vigor,
-            'max_vigor': character.max_vigor,
-            'clarity': character.clarity,
-            'max_clarity': character.max_clarity,
-            'spirit': character.spirit,
-            'max_spirit': character.max_spirit,
-            'guard': character.guard,
-            'max_guard': character.max_guard,
-            'armor': character.armor,
-            'is_mortally_wounded': character.is_mortally_wounded,
-            'is_wounded': character.is_wounded,
-            'is_impaired': character.is_impaired,
-            'is_fatigued': character.is_fatigued,
-            'is_scarred': character.is_scarred,
-            'is_alive': character.is_alive,
-            'notes': character.notes,
-            'profile_image_base64': base64.b64encode(character.profile_image).decode() if character.profile_image else ""
-        }
-        csv_data.append(row)
-    
+    csv_data = [
+        _character_export_row(_character_snapshot(character), character)
+        for character in characters.values()
+    ]
+
     # Convert to CSV string
     output = io.StringIO()
     if csv_data:
@@ -213,7 +418,7 @@ def import_characters_from_csv(csv_content: str) -> Dict[str, Character]:
                 is_scarred=row['is_scarred'].lower() == 'true',
                 is_alive=row['is_alive'].lower() == 'true',
                 notes=row.get('notes', ''),
-                profile_image=profile_image
+                profile_image_sha=_store_image(profile_image) if profile_image else None
             )
             
             characters[character.name] = character
@@ -261,10 +466,10 @@ def character_creation_page(characters):
         if submitted:
             if name and name not in characters:
                 # Process uploaded image
-                image_data = None
+                image_sha = None
                 if uploaded_image is not None:
-                    image_data = uploaded_image.read()
-                
+                    image_sha = _store_image(uploaded_image.read())
+
                 new_character = Character(
                     name=name,
                     vigor=vigor,
@@ -277,7 +482,7 @@ def character_creation_page(characters):
                     max_guard=guard,
                     armor=armor,
                     notes=notes,
-                    profile_image=image_data
+                    profile_image_sha=image_sha
                 )
                 save_character(new_character)
                 st.success(f"Character '{name}' created successfully!")
@@ -287,225 +492,440 @@ def character_creation_page(characters):
             else:
                 st.error("Please enter a character name!")
 
+@st.fragment
+def _stats_panel(character):
+    """Stats column of the management page; reruns independently."""
+    st.subheader(f"📋 {character.name}")
+
+    # Status indicators
+    mask = character.status_mask
+    _render_primary_status(mask)
+    _render_secondary_status(mask)
+
+    # Stats display
+    st.markdown("### Current Stats")
+    stats_col1, stats_col2 = st.columns(2)
+
+    with stats_col1:
+        st.metric("VIG", _STAT_FMT(character.vigor, character.max_vigor))
+        st.metric("CLA", _STAT_FMT(character.clarity, character.max_clarity))
+        st.metric("SPI", _STAT_FMT(character.spirit, character.max_spirit))
+
+    with stats_col2:
+        st.metric("GRD", _STAT_FMT(character.guard, character.max_guard))
+        st.metric("ARM", character.armor)
+
+@st.fragment
+def _quick_actions(character):
+    """Quick actions column of the management page; reruns independently."""
+    st.subheader("Quick Actions")
+
+    # Healing/Restoration
+    if st.button("🏥 Full Heal", key=f"heal_{character.name}"):
+        character.reset_to_full()
+        save_character(character)
+        st.success("Character fully healed!")
+        st.rerun()
+
+    # Manual stat adjustments
+    st.markdown("**Manual Adjustments:**")
+
+    vigor_change = st.number_input("VIG +/-", value=0, key=f"vigor_{character.name}")
+    if st.button("Apply VIG Change", key=f"apply_vigor_{character.name}"):
+        character.vigor = max(0, min(character.vigor + vigor_change, character.max_vigor))
+        if character.vigor <= 0:
+            character.is_alive = False
+        elif character.vigor == character.max_vigor:
+            character.is_wounded = False
+            character.is_mortally_wounded = False
+        save_character(character)
+        st.rerun()
+
+    guard_change = st.number_input("GRD +/-", value=0, key=f"guard_{character.name}")
+    if st.button("Apply GRD Change", key=f"apply_guard_{character.name}"):
+        character.guard = max(0, min(character.guard + guard_change, character.max_guard))
+        save_character(character)
+        st.rerun()
+
+    # Status toggles
+    st.markdown("**Status Toggles:**")
+
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        if st.button(
+            f"{'✅ Clear Impaired' if character.is_impaired else '🔴 Mark Impaired'}",
+            key=f"toggle_impaired_{character.name}",
+            type="secondary"
+        ):
+            character.is_impaired = not character.is_impaired
+            save_character(character)
+            st.rerun()
+
+    with col_b:
+        if st.button(
+            f"{'✅ Clear Fatigued' if character.is_fatigued else '😴 Mark Fatigued'}",
+            key=f"toggle_fatigued_{character.name}",
+            type="secondary"
+        ):
+            character.is_fatigued = not character.is_fatigued
+            save_character(character)
+            st.rerun()
+
+    with col_c:
+        if st.button(
+            f"{'✅ Clear Scar' if character.is_scarred else '🔥 Mark Scarred'}",
+            key=f"toggle_scarred_{character.name}",
+            type="secondary"
+        ):
+            character.is_scarred = not character.is_scarred
+            save_character(character)
+            st.rerun()
+
+@st.fragment
+def _character_actions(character):
+    """Image/notes/edit/delete column of the management page; reruns independently."""
+    st.subheader("Character Actions")
+
+    # Profile Image section
+    image_data = _get_image(character.profile_image_sha)
+    with st.expander("🖼️ Profile Image", expanded=bool(image_data)):
+        if image_data:
+            st.markdown("**Current Profile Image:**")
+            try:
+                st.image(_make_thumbnail(image_data), width=200, caption=f"{character.name}'s Profile")
+            except Exception as e:
+                st.error("Error displaying image. Please upload a new one.")
+
+        st.markdown("**Upload or change profile image:**")
+        new_image = st.file_uploader(
+            "Choose image file",
+            type=['png', 'jpg', 'jpeg', 'gif', 'bmp'],
+            key=f"image_upload_{character.name}",
+            help="Upload a character portrait or photo"
+        )
+
+        col_save_img, col_clear_img = st.columns(2)
+        with col_save_img:
+            if st.button("💾 Save Image", key=f"save_image_{character.name}"):
+                if new_image is not None:
+                    character.profile_image_sha = _store_image(new_image.read())
+                    save_character(character)
+                    st.success("Image saved!")
+                    st.rerun()
+                else:
+                    st.warning("Please select an image first!")
+
+        with col_clear_img:
+            if st.button("🗑️ Remove Image", key=f"clear_image_{character.name}"):
+                character.profile_image_sha = None
+                save_character(character)
+                st.success("Image removed!")
+                st.rerun()
+
+    # Notes section
+    with st.expander("📝 Character Notes", expanded=bool(character.notes)):
+        st.markdown("**Add or edit notes about this character:**")
+        notes_text = st.text_area(
+            "Notes",
+            value=character.notes,
+            height=100,
+            placeholder="Add notes about this character (equipment, backstory, special abilities, etc.)",
+            key=f"notes_{character.name}",
+            label_visibility="collapsed"
+        )
+
+        col_save, col_clear = st.columns(2)
+        with col_save:
+            if st.button("💾 Save Notes", key=f"save_notes_{character.name}"):
+                character.notes = notes_text
+                save_character(character)
+                st.success("Notes saved!")
+                st.rerun()
+
+        with col_clear:
+            if st.button("🗑️ Clear Notes", key=f"clear_notes_{character.name}"):
+                character.notes = ""
+                save_character(character)
+                st.success("Notes cleared!")
+                st.rerun()
+
+        if character.notes:
+            st.markdown("**Current Notes:**")
+            st.info(character.notes)
+
+    # Edit character
+    with st.expander("✏️ Edit Character"):
+        with st.form(f"edit_{character.name}"):
+            new_max_vigor = st.number_input("Max VIG", value=character.max_vigor, min_value=1)
+            new_max_clarity = st.number_input("Max CLA", value=character.max_clarity, min_value=1)
+            new_max_spirit = st.number_input("Max SPI", value=character.max_spirit, min_value=1)
+            new_max_guard = st.number_input("Max GRD", value=character.max_guard, min_value=0)
+            new_armor = st.number_input("ARM", value=character.armor, min_value=0)
+
+            if st.form_submit_button("Update Character"):
+                character.max_vigor = new_max_vigor
+                character.max_clarity = new_max_clarity
+                character.max_spirit = new_max_spirit
+                character.max_guard = new_max_guard
+                character.armor = new_armor
+
+                # Adjust current values if they exceed new maximums
+                character.vigor = min(character.vigor, character.max_vigor)
+                character.clarity = min(character.clarity, character.max_clarity)
+                character.spirit = min(character.spirit, character.max_spirit)
+                character.guard = min(character.guard, character.max_guard)
+
+                save_character(character)
+                st.success("Character updated!")
+                st.rerun()
+
+    # Delete character
+    if st.button("🗑️ Delete Character", key=f"delete_{character.name}"):
+        delete_character(character.name)
+        st.success(f"Character '{character.name}' deleted!")
+        st.rerun()
+
 def character_management_page(characters):
     """Character management page."""
     st.header("Character Management")
-    
+
     if not characters:
         st.info("No characters created yet. Go to 'Character Creation' to add some!")
         return
-    
+
     # Character selection
     selected_char_name = st.selectbox("Select Character:", list(characters.keys()))
-    
+
     if selected_char_name:
         character = characters[selected_char_name]
-        
+
         col1, col2, col3 = st.columns([2, 1, 1])
-        
+
         with col1:
-            st.subheader(f"📋 {character.name}")
-            
-            # Status indicators
-            if not character.is_alive:
-                st.error("💀 SLAIN")
-            elif character.is_mortally_wounded:
-                st.warning("⚠️ MORTALLY WOUNDED")
-            elif character.is_wounded:
-                st.warning("🩸 WOUNDED")
-            else:
-                st.success("✅ Healthy")
-            
-            # Additional status indicators
-            status_cols = st.columns(3)
-            with status_cols[0]:
-                if character.is_impaired:
-                    st.warning("🔴 IMPAIRED")
-            with status_cols[1]:
-                if character.is_fatigued:
-                    st.warning("😴 FATIGUED")
-            with status_cols[2]:
-                if character.is_scarred:
-                    st.warning("🔥 SCARRED")
-            
-            # Stats display
-            st.markdown("### Current Stats")
-            stats_col1, stats_col2 = st.columns(2)
-            
-            with stats_col1:
-                st.metric("VIG", f"{character.vigor}/{character.max_vigor}")
-                st.metric("CLA", f"{character.clarity}/{character.max_clarity}")
-                st.metric("SPI", f"{character.spirit}/{character.max_spirit}")
-            
-            with stats_col2:
-                st.metric("GRD", f"{character.guard}/{character.max_guard}")
-                st.metric("ARM", character.armor)
-        
+            _stats_panel(character)
+
         with col2:
-            st.subheader("Quick Actions")
-            
-            # Healing/Restoration
-            if st.button("🏥 Full Heal", key=f"heal_{selected_char_name}"):
-                character.reset_to_full()
-                save_character(character)
-                st.success("Character fully healed!")
-                st.rerun()
-            
-            # Manual stat adjustments
-            st.markdown("**Manual Adjustments:**")
-            
-            vigor_change = st.number_input("VIG +/-", value=0, key=f"vigor_{selected_char_name}")
-            if st.button("Apply VIG Change", key=f"apply_vigor_{selected_char_name}"):
-                character.vigor = max(0, min(character.vigor + vigor_change, character.max_vigor))
-                if character.vigor <= 0:
-                    character.is_alive = False
-                elif character.vigor == character.max_vigor:
-                    character.is_wounded = False
-                    character.is_mortally_wounded = False
-                save_character(character)
-                st.rerun()
-            
-            guard_change = st.number_input("GRD +/-", value=0, key=f"guard_{selected_char_name}")
-            if st.button("Apply GRD Change", key=f"apply_guard_{selected_char_name}"):
-                character.guard = max(0, min(character.guard + guard_change, character.max_guard))
-                save_character(character)
-                st.rerun()
-            
-            # Status toggles
-            st.markdown("**Status Toggles:**")
-            
-            col_a, col_b, col_c = st.columns(3)
-            with col_a:
-                if st.button(
-                    f"{'✅ Clear Impaired' if character.is_impaired else '🔴 Mark Impaired'}", 
-                    key=f"toggle_impaired_{selected_char_name}",
-                    type="secondary"
-                ):
-                    character.is_impaired = not character.is_impaired
-                    save_character(character)
-                    st.rerun()
-            
-            with col_b:
-                if st.button(
-                    f"{'✅ Clear Fatigued' if character.is_fatigued else '😴 Mark Fatigued'}", 
-                    key=f"toggle_fatigued_{selected_char_name}",
-                    type="secondary"
-                ):
-                    character.is_fatigued = not character.is_fatigued
-                    save_character(character)
-                    st.rerun()
-            
-            with col_c:
-                if st.button(
-                    f"{'✅ Clear Scar' if character.is_scarred else '🔥 Mark Scarred'}", 
-                    key=f"toggle_scarred_{selected_char_name}",
-                    type="secondary"
-                ):
-                    character.is_scarred = not character.is_scarred
-                    save_character(character)
-                    st.rerun()
-        
+            _quick_actions(character)
+
         with col3:
-            st.subheader("Character Actions")
-            
-            # Profile Image section
-            with st.expander("🖼️ Profile Image", expanded=bool(character.profile_image)):
-                if character.profile_image:
-                    st.markdown("**Current Profile Image:**")
-                    try:
-                        image = Image.open(io.BytesIO(character.profile_image))
-                        st.image(image, width=200, caption=f"{character.name}'s Profile")
-                    except Exception as e:
-                        st.error("Error displaying image. Please upload a new one.")
-                
-                st.markdown("**Upload or change profile image:**")
-                new_image = st.file_uploader(
-                    "Choose image file",
-                    type=['png', 'jpg', 'jpeg', 'gif', 'bmp'],
-                    key=f"image_upload_{selected_char_name}",
-                    help="Upload a character portrait or photo"
-                )
-                
-                col_save_img, col_clear_img = st.columns(2)
-                with col_save_img:
-                    if st.button("💾 Save Image", key=f"save_image_{selected_char_name}"):
-                        if new_image is not None:
-                            character.profile_image = new_image.read()
-                            save_character(character)
-                            st.success("Image saved!")
-                            st.rerun()
-                        else:
-                            st.warning("Please select an image first!")
-                
-                with col_clear_img:
-                    if st.button("🗑️ Remove Image", key=f"clear_image_{selected_char_name}"):
-                        character.profile_image = None
-                        save_character(character)
-                        st.success("Image removed!")
-                        st.rerun()
-            
-            # Notes section
-            with st.expander("📝 Character Notes", expanded=bool(character.notes)):
-                st.markdown("**Add or edit notes about this character:**")
-                notes_text = st.text_area(
-                    "Notes",
-                    value=character.notes,
-                    height=100,
-                    placeholder="Add notes about this character (equipment, backstory, special abilities, etc.)",
-                    key=f"notes_{selected_char_name}",
-                    label_visibility="collapsed"
-                )
-                
-                col_save, col_clear = st.columns(2)
-                with col_save:
-                    if st.button("💾 Save Notes", key=f"save_notes_{selected_char_name}"):
-                        character.notes = notes_text
-                        save_character(character)
-                        st.success("Notes saved!")
-                        st.rerun()
-                
-                with col_clear:
-                    if st.button("🗑️ Clear Notes", key=f"clear_notes_{selected_char_name}"):
-                        character.notes = ""
-                        save_character(character)
-                        st.success("Notes cleared!")
-                        st.rerun()
-                
-                if character.notes:
-                    st.markdown("**Current Notes:**")
-                    st.info(character.notes)
-            
-            # Edit character
-            with st.expander("✏️ Edit Character"):
-                with st.form(f"edit_{selected_char_name}"):
-                    new_max_vigor = st.number_input("Max VIG", value=character.max_vigor, min_value=1)
-                    new_max_clarity = st.number_input("Max CLA", value=character.max_clarity, min_value=1)
-                    new_max_spirit = st.number_input("Max SPI", value=character.max_spirit, min_value=1)
-                    new_max_guard = st.number_input("Max GRD", value=character.max_guard, min_value=0)
-                    new_armor = st.number_input("ARM", value=character.armor, min_value=0)
-                    
-                    if st.form_submit_button("Update Character"):
-                        character.max_vigor = new_max_vigor
-                        character.max_clarity = new_max_clarity
-                        character.max_spirit = new_max_spirit
-                        character.max_guard = new_max_guard
-                        character.armor = new_armor
-                        
-                        # Adjust current values if they exceed new maximums
-                        character.vigor = min(character.vigor, character.max_vigor)
-                        character.clarity = min(character.clarity, character.max_clarity)
-                        character.spirit = min(character.spirit, character.max_spirit)
-                        character.guard = min(character.guard, character.max_guard)
-                        
-                        save_character(character)
-                        st.success("Character updated!")
-                        st.rerun()
-            
-            # Delete character
-            if st.button("🗑️ Delete Character", key=f"delete_{selected_char_name}"):
-                delete_character(selected_char_name)
-                st.success(f"Character '{selected_char_name}' deleted!")
-                st.rerun()
+            _character_actions(character)
+
+def _render_primary_status(mask: int):
+    """Render the highest-priority status banner for a packed status mask."""
+    if not mask & ALIVE_BIT:
+        st.error("💀 SLAIN")
+    elif mask & MORTAL_BIT:
+        st.warning("⚠️ Mortally Wounded")
+    elif mask & WOUNDED_BIT:
+        st.warning("🩸 Wounded")
+    else:
+        st.success("✅ Healthy")
+
+def _render_secondary_status(mask: int):
+    """Render impaired/fatigued/scarred indicators for a packed status mask."""
+    if mask & (IMPAIRED_BIT | FATIGUED_BIT | SCARRED_BIT):
+        status_cols = st.columns(3)
+        if mask & IMPAIRED_BIT:
+            status_cols[0].warning("🔴 Impaired")
+        if mask & FATIGUED_BIT:
+            status_cols[1].warning("😴 Fatigued")
+        if mask & SCARRED_BIT:
+            status_cols[2].warning("🔥 Scarred")
+
+@st.fragment
+def _render_card(name, character, show_thumbs=True):
+    """One character card in the overview grid; reruns independently."""
+    # Profile image
+    image_data = _get_image(character.profile_image_sha) if show_thumbs else None
+    if image_data:
+        try:
+            st.image(_make_thumbnail(image_data), width=150, caption=name)
+        except Exception:
+            st.markdown(f"### {name}")
+            st.caption("🖼️ Image error")
+    else:
+        st.markdown(f"### {name}")
+
+    # Character status
+    mask = character.status_mask
+    _render_primary_status(mask)
+
+    # Stats
+    st.markdown("**Stats:**")
+    vigor_ratio = character.vigor / character.max_vigor if character.max_vigor > 0 else 0.0
+    guard_ratio = character.guard / character.max_guard if character.max_guard > 0 else 0.0
+
+    st.progress(vigor_ratio, text=_VIG_BAR_FMT(character.vigor, character.max_vigor))
+    st.progress(guard_ratio, text=_GRD_BAR_FMT(character.guard, character.max_guard))
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.metric("CLA", _STAT_FMT(character.clarity, character.max_clarity))
+        st.metric("ARM", character.armor)
+    with col_b:
+        st.metric("SPI", _STAT_FMT(character.spirit, character.max_spirit))
+        if character.is_mortally_wounded:
+            st.error("⚠️ Mortally Wounded")
+
+    # Additional status indicators
+    _render_secondary_status(mask)
+
+    # Notes indicator
+    if character.notes:
+        with st.expander("📝 Notes"):
+            st.write(character.notes)
+
+    # Target selection button (only for alive characters)
+    if character.is_alive:
+        is_selected = st.session_state.get('selected_target') == name
+
+        if st.button(
+            "🎯 Selected" if is_selected else "Select as Target",
+            key=f"select_{name}",
+            type="primary" if is_selected else "secondary",
+            use_container_width=True
+        ):
+            st.session_state.selected_target = name
+            # selected_target drives widgets outside this fragment (the
+            # target selectbox, the target banner, other cards'
+            # highlights), so a card-scoped rerun isn't enough here.
+            st.rerun(scope="app")
+
+    st.divider()
+
+@st.fragment
+def _character_overview(characters):
+    """Character overview section of the combat page; reruns independently."""
+    # Character Overview Section
+    st.subheader("Character Overview")
+    
+    # View toggle
+    view_mode = st.radio("View Mode:", ["Cards", "Table"], horizontal=True)
+    
+    # Filter options
+    col1, col2 = st.columns(2)
+    with col1:
+        status_filter = st.selectbox(
+            "Filter by Status:",
+            ["All", "Alive", "Dead", "Wounded", "Mortally Wounded", "Impaired", "Fatigued", "Scarred"]
+        )
+    with col2:
+        sort_by = st.selectbox(
+            "Sort by:",
+            ["Name", "VIG", "GRD"]
+        )
+    
+    # Filter and sort once per roster change, not once per rerun; the
+    # cache yields names, so pair them with the live objects here.
+    snapshot = _roster_snapshot(characters)
+    sorted_names = _overview_names(snapshot, status_filter, sort_by, characters)
+    sorted_items = [(name, characters[name]) for name in sorted_names]
+
+    if not sorted_items:
+        st.warning(f"No characters match the filter: {status_filter}")
+    else:
+        # Render only the current page of characters; the summary stats
+        # below still cover the whole filtered selection.
+        page_count = (len(sorted_items) + PAGE_SIZE - 1) // PAGE_SIZE
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+            page_items = sorted_items[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        else:
+            page_items = sorted_items
+
+        if view_mode == "Cards":
+            # Card view
+            st.markdown(f"**📋 {len(sorted_items)} Character(s)**")
+
+            # Skip the image pipeline entirely when thumbnails are off
+            # (defaults off for large rosters).
+            show_thumbs = st.toggle("Show thumbnails", value=len(sorted_items) <= 12, key="show_thumbs")
+
+
+            # Display cards in rows of 3
+            for row_start in range(0, len(page_items), 3):
+                with st.container():
+                    cols = st.columns(3, gap="small")
+                    for col, (name, character) in zip(cols, page_items[row_start:row_start + 3]):
+                        with col:
+                            _render_card(name, character, show_thumbs)
+        
+        else:
+            # Table view
+            import pandas as pd  # deferred: only the table view needs it
+
+            st.markdown(f"**📊 Character Table ({len(sorted_items)} characters)**")
+
+            # Build all rows at once and render a single dataframe widget
+            rows = [
+                {
+                    "Name": _IMAGE_NAME_FMT(name) if character.profile_image_sha else name,
+                    "Status": character.status_label,
+                    "VIG": _STAT_FMT(character.vigor, character.max_vigor),
+                    "GRD": _STAT_FMT(character.guard, character.max_guard),
+                    "CLA": _STAT_FMT(character.clarity, character.max_clarity),
+                    "SPI": _STAT_FMT(character.spirit, character.max_spirit),
+                    "ARM": character.armor,
+                    "Conditions": character.conditions_label,
+                    "Notes": character.notes_preview or "—",
+                }
+                for name, character in page_items
+            ]
+            df = pd.DataFrame(rows)
+
+            st.caption("Select a row to target that character.")
+            event = st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="character_table",
+                column_config={
+                    "Name": st.column_config.TextColumn(width="medium"),
+                    "VIG": st.column_config.TextColumn(width="small", help="Vigor (current/max)"),
+                    "GRD": st.column_config.TextColumn(width="small", help="Guard (current/max)"),
+                    "CLA": st.column_config.TextColumn(width="small", help="Clarity (current/max)"),
+                    "SPI": st.column_config.TextColumn(width="small", help="Spirit (current/max)"),
+                    "ARM": st.column_config.NumberColumn(width="small", help="Armor"),
+                    "Notes": st.column_config.TextColumn(width="medium"),
+                }
+            )
+
+            # Row selection doubles as target selection (alive characters
+            # only). The widget keeps its selection across filter/page
+            # changes, so the positional index can be stale: ignore rows
+            # past the end of the current page, and only act on a
+            # selection we haven't handled yet so a lingering row doesn't
+            # keep overwriting the target selectbox on every rerun.
+            if event.selection.rows:
+                row = event.selection.rows[0]
+                if row < len(page_items) and row != st.session_state.get('last_table_row'):
+                    st.session_state.last_table_row = row
+                    selected_name = page_items[row][0]
+                    if characters[selected_name].is_alive:
+                        st.session_state.selected_target = selected_name
+            else:
+                st.session_state.last_table_row = None
+        
+        # Summary statistics (computed only when shown)
+        if st.toggle("📈 Show summary statistics", value=False, key="show_stats"):
+            overview_stats = _overview_stats(snapshot, status_filter, characters)
+
+            metrics = [
+                ("Total Characters", overview_stats['total']),
+                ("Alive", overview_stats['alive']),
+                ("Wounded", overview_stats['wounded']),
+                ("Mortally Wounded", overview_stats['mortally_wounded']),
+                ("Impaired", overview_stats['impaired']),
+                ("Fatigued", overview_stats['fatigued']),
+                ("Scarred", overview_stats['scarred']),
+            ]
+            for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+                col.metric(label, value)
+
+            if overview_stats['dead'] > 0:
+                st.error(f"💀 {overview_stats['dead']} character(s) have been slain")
 
 def combat_resolution_page(characters):
     """Combat resolution page."""
@@ -515,8 +935,9 @@ def combat_resolution_page(characters):
         st.info("No characters created yet. Go to 'Character Creation' to add some!")
         return
     
-    # Filter out dead characters for combat
-    alive_characters = {name: char for name, char in characters.items() if char.is_alive}
+    # Filter out dead characters for combat using the maintained alive index
+    # (sorted for a stable selectbox order).
+    alive_characters = {name: characters[name] for name in sorted(_alive_index()) if name in characters}
     
     if not alive_characters:
         st.warning("No living characters available for combat!")
@@ -527,19 +948,18 @@ def combat_resolution_page(characters):
     with col1:
         st.subheader("Apply Damage")
         
-        # Initialize selected target in session state if not exists
-        if 'selected_target' not in st.session_state:
-            st.session_state.selected_target = list(alive_characters.keys())[0] if alive_characters else None
-        
-        # Ensure selected target is still alive and valid
-        if st.session_state.selected_target not in alive_characters:
-            st.session_state.selected_target = list(alive_characters.keys())[0] if alive_characters else None
-        
+        # Materialize the alive-name list once instead of per lookup
+        alive_names = list(alive_characters)
+
+        # Ensure selected target exists and is still alive
+        if st.session_state.get('selected_target') not in alive_characters:
+            st.session_state.selected_target = alive_names[0] if alive_names else None
+
         # Target selection (can be overridden by clicking characters below)
         target_name = st.selectbox(
-            "Target Character:", 
-            list(alive_characters.keys()),
-            index=list(alive_characters.keys()).index(st.session_state.selected_target) if st.session_state.selected_target in alive_characters else 0
+            "Target Character:",
+            alive_names,
+            index=alive_names.index(st.session_state.selected_target)
         )
         
         # Update session state when selectbox changes
@@ -596,273 +1016,16 @@ def combat_resolution_page(characters):
             st.markdown(f"**Target:** {target_name}")
             st.markdown(f"**Incoming Damage:** {result['original_damage']}")
             
-            for log_entry in result['damage_log']:
-                if "MORTAL WOUND" in log_entry:
-                    st.error(log_entry)
-                elif "SLAIN" in log_entry:
-                    st.error(log_entry)
-                elif "Armor absorbed" in log_entry:
-                    st.info(log_entry)
-                else:
-                    st.warning(log_entry)
-    
-    # Character Overview Section
-    st.subheader("Character Overview")
-    
-    # View toggle
-    view_mode = st.radio("View Mode:", ["Cards", "Table"], horizontal=True)
-    
-    # Filter options
-    col1, col2 = st.columns(2)
-    with col1:
-        status_filter = st.selectbox(
-            "Filter by Status:",
-            ["All", "Alive", "Dead", "Wounded", "Mortally Wounded", "Impaired", "Fatigued", "Scarred"]
-        )
-    with col2:
-        sort_by = st.selectbox(
-            "Sort by:",
-            ["Name", "VIG", "GRD"]
-        )
-    
-    # Filter characters based on status
-    filtered_chars = {}
-    for name, char in characters.items():
-        if status_filter == "All":
-            filtered_chars[name] = char
-        elif status_filter == "Alive" and char.is_alive:
-            filtered_chars[name] = char
-        elif status_filter == "Dead" and not char.is_alive:
-            filtered_chars[name] = char
-        elif status_filter == "Wounded" and char.is_alive and char.is_wounded:
-            filtered_chars[name] = char
-        elif status_filter == "Mortally Wounded" and char.is_alive and char.is_mortally_wounded:
-            filtered_chars[name] = char
-        elif status_filter == "Impaired" and char.is_alive and char.is_impaired:
-            filtered_chars[name] = char
-        elif status_filter == "Fatigued" and char.is_alive and char.is_fatigued:
-            filtered_chars[name] = char
-        elif status_filter == "Scarred" and char.is_alive and char.is_scarred:
-            filtered_chars[name] = char
+            for tag, *args in result['damage_log']:
+                render, template = _EVENT_RENDERERS[tag]
+                render(template.format(*args))
     
-    if not filtered_chars:
-        st.warning(f"No characters match the filter: {status_filter}")
-    else:
-        # Sort characters
-        if sort_by == "Name":
-            sorted_chars = dict(sorted(filtered_chars.items()))
-        elif sort_by == "VIG":
-            sorted_chars = dict(sorted(filtered_chars.items(), key=lambda x: x[1].vigor, reverse=True))
-        elif sort_by == "GRD":
-            sorted_chars = dict(sorted(filtered_chars.items(), key=lambda x: x[1].guard, reverse=True))
-        
-        if view_mode == "Cards":
-            # Card view
-            st.markdown(f"**📋 {len(sorted_chars)} Character(s)**")
-            
-            # Display cards in rows of 3
-            chars_list = list(sorted_chars.items())
-            for i in range(0, len(chars_list), 3):
-                cols = st.columns(3)
-                for j, (name, character) in enumerate(chars_list[i:i+3]):
-                    with cols[j]:
-                        # Card container
-                        with st.container():
-                            # Profile image
-                            if character.profile_image:
-                                try:
-                                    image = Image.open(io.BytesIO(character.profile_image))
-                                    st.image(image, width=150, caption=name)
-                                except Exception:
-                                    st.markdown(f"### {name}")
-                                    st.caption("🖼️ Image error")
-                            else:
-                                st.markdown(f"### {name}")
-                            
-                            # Character status
-                            if not character.is_alive:
-                                st.error("💀 SLAIN")
-                            elif character.is_mortally_wounded:
-                                st.warning("⚠️ Mortally Wounded")
-                            elif character.is_wounded:
-                                st.warning("🩸 Wounded")
-                            else:
-                                st.success("✅ Healthy")
-                            
-                            # Stats
-                            st.markdown("**Stats:**")
-                            vigor_pct = (character.vigor / character.max_vigor) * 100 if character.max_vigor > 0 else 0
-                            guard_pct = (character.guard / character.max_guard) * 100 if character.max_guard > 0 else 0
-                            
-                            st.progress(vigor_pct / 100, text=f"VIG: {character.vigor}/{character.max_vigor}")
-                            st.progress(guard_pct / 100, text=f"GRD: {character.guard}/{character.max_guard}")
-                            
-                            col_a, col_b = st.columns(2)
-                            with col_a:
-                                st.metric("CLA", f"{character.clarity}/{character.max_clarity}")
-                                st.metric("ARM", character.armor)
-                            with col_b:
-                                st.metric("SPI", f"{character.spirit}/{character.max_spirit}")
-                                if character.is_mortally_wounded:
-                                    st.error("⚠️ Mortally Wounded")
-                            
-                            # Additional status indicators
-                            if character.is_impaired or character.is_fatigued or character.is_scarred:
-                                status_row = st.columns(3)
-                                with status_row[0]:
-                                    if character.is_impaired:
-                                        st.warning("🔴 Impaired")
-                                with status_row[1]:
-                                    if character.is_fatigued:
-                                        st.warning("😴 Fatigued")
-                                with status_row[2]:
-                                    if character.is_scarred:
-                                        st.warning("🔥 Scarred")
-                            
-                            # Notes indicator
-                            if character.notes:
-                                with st.expander("📝 Notes"):
-                                    st.write(character.notes)
-                            
-                            # Target selection button (only for alive characters)
-                            if character.is_alive:
-                                button_type = "primary" if st.session_state.get('selected_target') == name else "secondary"
-                                button_text = "🎯 Selected" if st.session_state.get('selected_target') == name else "Select as Target"
-                                
-                                if st.button(button_text, key=f"select_{name}", type=button_type, use_container_width=True):
-                                    st.session_state.selected_target = name
-                                    st.rerun()
-                            
-                            st.divider()
-        
-        else:
-            # Table view
-            st.markdown(f"**📊 Character Table ({len(sorted_chars)} characters)**")
-            
-            # Add header row
-            header_col1, header_col2, header_col3, header_col4, header_col5, header_col6, header_col7, header_col8, header_col9, header_col10 = st.columns([1, 1, 0.7, 0.7, 0.7, 0.7, 0.5, 1, 1, 0.8])
-            with header_col1:
-                st.write("**Name**")
-            with header_col2:
-                st.write("**Status**")
-            with header_col3:
-                st.write("**VIG**")
-            with header_col4:
-                st.write("**GRD**")
-            with header_col5:
-                st.write("**CLA**")
-            with header_col6:
-                st.write("**SPI**")
-            with header_col7:
-                st.write("**ARM**")
-            with header_col8:
-                st.write("**Conditions**")
-            with header_col9:
-                st.write("**Notes**")
-            with header_col10:
-                st.write("**Target**")
-            
-            st.markdown("---")
-            
-            # Display table with selection buttons
-            for name, character in sorted_chars.items():
-                if not character.is_alive:
-                    status = "💀 Slain"
-                elif character.is_mortally_wounded:
-                    status = "⚠️ Mortally Wounded"
-                elif character.is_wounded:
-                    status = "🩸 Wounded"
-                else:
-                    status = "✅ Healthy"
-                
-                # Create a row for each character
-                col1, col2, col3, col4, col5, col6, col7, col8, col9, col10 = st.columns([1, 1, 0.7, 0.7, 0.7, 0.7, 0.5, 1, 1, 0.8])
-                
-                with col1:
-                    if character.profile_image:
-                        st.write(f"🖼️ **{name}**")
-                    else:
-                        st.write(f"**{name}**")
-                with col2:
-                    st.write(status)
-                with col3:
-                    st.write(f"{character.vigor}/{character.max_vigor}")
-                with col4:
-                    st.write(f"{character.guard}/{character.max_guard}")
-                with col5:
-                    st.write(f"{character.clarity}/{character.max_clarity}")
-                with col6:
-                    st.write(f"{character.spirit}/{character.max_spirit}")
-                with col7:
-                    st.write(str(character.armor))
-                with col8:
-                    # Show conditions
-                    conditions = []
-                    if character.is_impaired:
-                        conditions.append("🔴 Impaired")
-                    if character.is_fatigued:
-                        conditions.append("😴 Fatigued")
-                    if character.is_scarred:
-                        conditions.append("🔥 Scarred")
-                    
-                    if conditions:
-                        st.write(" | ".join(conditions))
-                    else:
-                        st.write("—")
-                with col9:
-                    # Show notes preview
-                    if character.notes:
-                        # Show first 30 characters with ellipsis
-                        notes_preview = character.notes[:30] + "..." if len(character.notes) > 30 else character.notes
-                        if st.button(f"📝 {notes_preview}", key=f"notes_preview_{name}", help=character.notes):
-                            # This button just shows the full notes in the tooltip
-                            pass
-                    else:
-                        st.write("—")
-                with col10:
-                    if character.is_alive:
-                        button_type = "primary" if st.session_state.get('selected_target') == name else "secondary"
-                        button_text = "🎯 Selected" if st.session_state.get('selected_target') == name else "Select"
-                        
-                        if st.button(button_text, key=f"table_select_{name}", type=button_type):
-                            st.session_state.selected_target = name
-                            st.rerun()
-                    else:
-                        st.write("—")
-        
-        # Summary statistics
-        st.subheader("📈 Summary Statistics")
-        
-        alive_count = sum(1 for char in sorted_chars.values() if char.is_alive)
-        dead_count = len(sorted_chars) - alive_count
-        wounded_count = sum(1 for char in sorted_chars.values() if char.is_alive and char.is_wounded)
-        mortally_wounded_count = sum(1 for char in sorted_chars.values() if char.is_alive and char.is_mortally_wounded)
-        impaired_count = sum(1 for char in sorted_chars.values() if char.is_alive and char.is_impaired)
-        fatigued_count = sum(1 for char in sorted_chars.values() if char.is_alive and char.is_fatigued)
-        scarred_count = sum(1 for char in sorted_chars.values() if char.is_alive and char.is_scarred)
-        
-        stat_col1, stat_col2, stat_col3, stat_col4, stat_col5, stat_col6, stat_col7 = st.columns(7)
-        
-        with stat_col1:
-            st.metric("Total Characters", len(sorted_chars))
-        with stat_col2:
-            st.metric("Alive", alive_count, delta=None)
-        with stat_col3:
-            st.metric("Wounded", wounded_count, delta=None)
-        with stat_col4:
-            st.metric("Mortally Wounded", mortally_wounded_count, delta=None)
-        with stat_col5:
-            st.metric("Impaired", impaired_count, delta=None)
-        with stat_col6:
-            st.metric("Fatigued", fatigued_count, delta=None)
-        with stat_col7:
-            st.metric("Scarred", scarred_count, delta=None)
-        
-        if dead_count > 0:
-            st.error(f"💀 {dead_count} character(s) have been slain")
+    _character_overview(characters)
+
 
 def data_management_page(characters):
     """Data management page for CSV export/import."""
+    import pandas as pd  # deferred: only the import preview needs it
     st.header("Data Management")
     st.markdown("Export your character data to CSV for backup, or import characters from a CSV file.")
     
@@ -951,6 +1114,7 @@ def data_management_page(characters):
                         if import_mode == "Replace all characters":
                             # Clear existing characters
                             st.session_state.characters = {}
+                            st.session_state.alive_names = set()
                         
                         # Add imported characters
                         conflicts = []
@@ -1029,6 +1193,7 @@ def data_management_page(characters):
             if st.button("🗑️ Delete All Characters", use_container_width=True):
                 if st.session_state.get('confirm_delete_all', False):
                     st.session_state.characters = {}
+                    st.session_state.alive_names = set()
                     st.session_state.confirm_delete_all = False
                     st.success("All characters deleted!")
                     st.rerun()